@@ -111,6 +111,10 @@ class TestConversationMemory:
         mock_client.get.assert_called_once()
         mock_client.setex.assert_called_once()
 
+        # The new turn and the thread's last update share a single timestamp
+        saved = ThreadContext.model_validate_json(mock_client.setex.call_args[0][2])
+        assert saved.turns[-1].timestamp == saved.last_updated_at
+
     @patch("utils.conversation_memory.get_storage")
     def test_add_turn_max_limit(self, mock_storage):
         """Test turn limit enforcement"""
@@ -0,0 +1,89 @@
+"""
+Tests for the in-memory conversation storage backend
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from utils.storage_backend import InMemoryStorage
+
+
+@pytest.fixture
+def storage():
+    backend = InMemoryStorage()
+    yield backend
+    backend.shutdown()
+
+
+class TestInMemoryStorage:
+    """Test TTL handling in InMemoryStorage"""
+
+    def test_get_returns_live_value(self, storage):
+        """Values inside their TTL are returned unchanged"""
+        storage.setex("thread:live", 60, "payload")
+
+        assert storage.get("thread:live") == "payload"
+        assert "thread:live" in storage._store
+
+    def test_get_missing_key(self, storage):
+        """Unknown keys return None"""
+        assert storage.get("thread:missing") is None
+
+    def test_get_removes_expired_entry(self, storage):
+        """Expired values return None and are evicted on read"""
+        with patch("utils.storage_backend.time.monotonic", return_value=1000.0):
+            storage.setex("thread:old", 10, "payload")
+
+        with patch("utils.storage_backend.time.monotonic", return_value=1010.0):
+            assert storage.get("thread:old") is None
+
+        assert "thread:old" not in storage._store
+
+    def test_cleanup_expired_keeps_live_entries(self, storage):
+        """The background sweep only drops entries past their expiry"""
+        with patch("utils.storage_backend.time.monotonic", return_value=1000.0):
+            storage.setex("thread:old", 10, "old")
+            storage.setex("thread:new", 100, "new")
+
+        with patch("utils.storage_backend.time.monotonic", return_value=1050.0):
+            storage._cleanup_expired()
+
+        assert list(storage._store) == ["thread:new"]
+
+    def test_shutdown_stops_cleanup_thread_promptly(self):
+        """shutdown() wakes the cleanup worker instead of waiting out its interval"""
+        backend = InMemoryStorage()
+        assert backend._cleanup_thread.is_alive()
+
+        backend.shutdown()
+
+        assert not backend._cleanup_thread.is_alive()
+
+    def test_cleanup_worker_skips_sweep_when_empty(self):
+        """An empty store does not trigger a locked sweep"""
+        backend = InMemoryStorage()
+        backend.shutdown()
+
+        backend._shutdown.clear()
+        backend._cleanup_interval = 0.01
+        calls = []
+
+        def fake_cleanup():
+            calls.append(True)
+            backend._shutdown.set()
+
+        with patch.object(backend, "_cleanup_expired", side_effect=fake_cleanup):
+            backend._store.clear()
+            worker = threading.Thread(target=backend._cleanup_worker)
+            worker.start()
+            time.sleep(0.05)
+            assert calls == []
+
+            backend.setex("thread:live", 60, "payload")
+            worker.join(timeout=1)
+
+        assert calls == [True]
+        assert not worker.is_alive()
@@ -361,11 +361,13 @@ def add_turn(
         logger.debug(f"[FLOW] Thread {thread_id} at max turns ({MAX_CONVERSATION_TURNS})")
         return False
 
+    now = datetime.now(timezone.utc).isoformat()
+
     # Create new turn with complete metadata
     turn = ConversationTurn(
         role=role,
         content=content,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=now,
         files=files,  # Preserved for cross-tool file context
         images=images,  # Preserved for cross-tool visual context
         tool_name=tool_name,  # Track which tool generated this turn
@@ -375,7 +377,7 @@ def add_turn(
     )
 
     context.turns.append(turn)
-    context.last_updated_at = datetime.now(timezone.utc).isoformat()
+    context.last_updated_at = now
 
     # Save back to storage and refresh TTL
     try:
@@ -39,7 +39,7 @@ class InMemoryStorage:
         timeout_hours = int(get_env("CONVERSATION_TIMEOUT_HOURS", "3") or "3")
         self._cleanup_interval = (timeout_hours * 3600) // 10
         self._cleanup_interval = max(300, self._cleanup_interval)  # Minimum 5 minutes
-        self._shutdown = False
+        self._shutdown = threading.Event()
 
         # Start background cleanup thread
         self._cleanup_thread = threading.Thread(target=self._cleanup_worker, daemon=True)
@@ -52,23 +52,28 @@ class InMemoryStorage:
     def set_with_ttl(self, key: str, ttl_seconds: int, value: str) -> None:
         """Store value with expiration time"""
         with self._lock:
-            expires_at = time.time() + ttl_seconds
+            expires_at = time.monotonic() + ttl_seconds
             self._store[key] = (value, expires_at)
-            logger.debug(f"Stored key {key} with TTL {ttl_seconds}s")
+            logger.debug("Stored key %s with TTL %ss", key, ttl_seconds)
 
     def get(self, key: str) -> Optional[str]:
         """Retrieve value if not expired"""
         with self._lock:
-            if key in self._store:
-                value, expires_at = self._store[key]
-                if time.time() < expires_at:
-                    logger.debug(f"Retrieved key {key}")
-                    return value
-                else:
-                    # Clean up expired entry
-                    del self._store[key]
-                    logger.debug(f"Key {key} expired and removed")
-        return None
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            expired = time.monotonic() >= expires_at
+            if expired:
+                # Clean up expired entry
+                del self._store[key]
+
+        # Log outside the lock so readers are not serialized on handler I/O
+        if expired:
+            logger.debug("Key %s expired and removed", key)
+            return None
+        logger.debug("Retrieved key %s", key)
+        return value
 
     def setex(self, key: str, ttl_seconds: int, value: str) -> None:
         """Redis-compatible setex method"""
@@ -76,24 +81,27 @@ class InMemoryStorage:
 
     def _cleanup_worker(self):
         """Background thread that periodically cleans up expired entries"""
-        while not self._shutdown:
-            time.sleep(self._cleanup_interval)
+        # Event.wait doubles as the sleep so shutdown() wakes the worker immediately
+        while not self._shutdown.wait(self._cleanup_interval):
+            # Nothing stored means nothing can expire; skip the sweep and its lock
+            if not self._store:
+                continue
             self._cleanup_expired()
 
     def _cleanup_expired(self):
         """Remove all expired entries"""
         with self._lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             expired_keys = [k for k, (_, exp) in self._store.items() if exp < current_time]
             for key in expired_keys:
                 del self._store[key]
 
-            if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired conversation threads")
+        if expired_keys:
+            logger.debug("Cleaned up %d expired conversation threads", len(expired_keys))
 
     def shutdown(self):
         """Graceful shutdown of background thread"""
-        self._shutdown = True
+        self._shutdown.set()
         if self._cleanup_thread.is_alive():
             self._cleanup_thread.join(timeout=1)
 